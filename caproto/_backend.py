@@ -51,12 +51,16 @@ def select_backend(name):
     backend.epics_to_python = _backend.epics_to_python
     backend.type_map = _backend.type_map
     backend.array_types = _backend.array_types
+    # Prebuilt for isinstance checks on hot paths, avoiding a per-call tuple
+    # concatenation of (list, tuple) + array_types.
+    backend.sequence_types = (list, tuple) + _backend.array_types
     backend.convert_values = _backend.convert_values
 
 
 backend = SimpleNamespace(
     backend_name=None, python_to_epics=None, epics_to_python=None,
-    type_map=None, array_types=None, convert_values=None,
+    type_map=None, array_types=None, sequence_types=None,
+    convert_values=None,
 )
 
 
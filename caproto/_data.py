@@ -6,7 +6,7 @@
 import copy
 import time
 import weakref
-from collections import defaultdict, namedtuple
+from collections import namedtuple
 from collections.abc import Iterable
 
 from ._backend import backend
@@ -20,6 +20,11 @@ from ._dbr import (DBR_STSACK_STRING, DBR_TYPES, AccessRights, AlarmSeverity,
 from ._utils import (CaprotoError, CaprotoValueError, ConversionDirection,
                      is_array_read_only)
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 __all__ = ('Forbidden',
            'ChannelAlarm',
            'ChannelByte',
@@ -66,12 +71,114 @@ def dbr_metadata_to_dict(dbr_metadata, string_encoding):
 
 def _read_only_property(key, doc=None):
     '''Create property that gives read-only access to instance._data[key]'''
+    # Note: property-plus-closure measures faster than a hand-rolled slotted
+    # descriptor on CPython (property.__get__ is C code; a Python-level
+    # __get__ pays a frame per access).  Hot paths such as verify_value read
+    # self._data directly and skip the descriptor altogether.
     if doc is None:
         doc = f"Read-only access to {key} data"
     return property(lambda self: self._data[key], doc=doc)
 
 
+# The alarm fields each DBR metadata struct shares with DBR_STSACK_STRING,
+# precomputed at import time so that ``ChannelData._read`` does not have to
+# probe every field with hasattr on each read.  The alarm string itself is
+# only read out via ChannelType.STSACK_STRING, which is special-cased before
+# this table is consulted.
+_dbr_alarm_fields = ('status', 'severity', 'ackt', 'acks')
+_alarm_fields_by_type = {
+    data_type: tuple(field for field in _dbr_alarm_fields
+                     if hasattr(dbr_class, field))
+    for data_type, dbr_class in DBR_TYPES.items()
+}
+
+# Likewise for the graphic/control limit fields filled in by
+# ``ChannelData._read_metadata``: the subset present on each DBR struct is
+# fixed, so probe it once here rather than with hasattr per read.  Most
+# structs (native and time types) have none, letting _read_metadata skip the
+# limit conversion entirely.
+_graphic_control_attrs = (GraphicControlBase.control_fields +
+                          GraphicControlBase.graphic_fields)
+_convert_attrs_by_type = {
+    data_type: tuple(attr for attr in _graphic_control_attrs
+                     if hasattr(dbr_class, attr))
+    for data_type, dbr_class in DBR_TYPES.items()
+}
+
+# Everything _read_metadata needs to know about a DBR struct class, resolved
+# at import time: (the ChannelType it serves, whether it has units, precision,
+# and a timestamp, the native type its limits convert to, and the
+# graphic/control fields it carries).
+_metadata_info_by_dbr_class = {}
+for _dbr_class in set(DBR_TYPES.values()):
+    _data_type = ChannelType(_dbr_class.DBR_ID)
+    _native_data_type = native_type(_data_type)
+    _metadata_info_by_dbr_class[_dbr_class] = (
+        _data_type,
+        hasattr(_dbr_class, 'units'),
+        hasattr(_dbr_class, 'precision'),
+        _data_type in time_types,
+        _native_data_type,
+        _convert_attrs_by_type[_data_type],
+    )
+del _dbr_class, _data_type, _native_data_type
+
+# _LongStringChannelType mirrors the CHAR values of ChannelType, and both are
+# IntEnums, so e.g. LONG_STRING and CHAR hash and compare equal -- enum
+# members cannot key the per-data-type caches directly.  Instead, each type
+# gets a unique small-int index: ChannelType members use their own value, and
+# long-string members are offset past the end of ChannelType.
+_long_string_index_offset = max(ChannelType) + 1
+
+
+def _type_index(data_type):
+    'Unique cache index for a ChannelType or _LongStringChannelType member'
+    if type(data_type) is _LongStringChannelType:
+        return _long_string_index_offset + data_type
+    return data_type
+
+
+# Precomputed per requested type index: (the native type values are converted
+# to, the ChannelType metadata is served as, whether the request is for a
+# native - metadata-free - type, the DBR struct class, the shared alarm
+# fields). Resolving these on every _read costs an enum containment check and
+# several dict lookups per call.
+#
+# Note: the DBR struct instances themselves are deliberately not pooled or
+# reused; they escape into the conversion cache and the subscription queues,
+# where in-flight updates reference them until serialized.
+_conversion_info_by_index = [None] * (
+    _long_string_index_offset + max(_LongStringChannelType) + 1)
+for _data_type in ChannelType:
+    _conversion_info_by_index[_type_index(_data_type)] = (
+        native_type(_data_type), _data_type, _data_type in native_types,
+        DBR_TYPES[_data_type], _alarm_fields_by_type[_data_type])
+for _data_type in _LongStringChannelType:
+    _native_data_type = ChannelType(_data_type)
+    _conversion_info_by_index[_type_index(_data_type)] = (
+        _LongStringChannelType.LONG_STRING, _native_data_type,
+        _native_data_type in native_types,
+        DBR_TYPES[_native_data_type],
+        _alarm_fields_by_type[_native_data_type])
+del _data_type, _native_data_type
+
+# All 256 single-byte values; CPython interns small ints but not 1-length
+# bytes objects.
+_one_byte = tuple(bytes([i]) for i in range(256))
+
+
+def _scalar_byte(value):
+    'bytes([value]) without the per-call list and 1-byte allocations'
+    if 0 <= value <= 255:
+        return _one_byte[value]
+    return bytes([value])  # raises ValueError, matching the old behavior
+
+
 class ChannelAlarm:
+    __slots__ = ('_channels', '_dead_channels', 'string_encoding',
+                 '_alarm_string_bytes', '_data',
+                 '__weakref__')
+
     def __init__(self, *, status=0, severity=0,
                  must_acknowledge_transient=True, severity_to_acknowledge=0,
                  alarm_string='', string_encoding='latin-1'):
@@ -95,8 +202,16 @@ class ChannelAlarm:
         string_encoding : str, optional
             String encoding of the alarm string.
         """
-        self._channels = weakref.WeakSet()
+        # A list of weak references to the connected ChannelData instances.
+        # A plain list iterates faster than a WeakSet in publish(); dead
+        # references are counted by the weakref callback and compacted
+        # opportunistically.
+        self._channels = []
+        self._dead_channels = 0
         self.string_encoding = string_encoding
+        # Encoded alarm_string, computed on first read() and invalidated
+        # when the alarm string changes.
+        self._alarm_string_bytes = None
         self._data = dict(
             status=status, severity=severity,
             must_acknowledge_transient=must_acknowledge_transient,
@@ -129,16 +244,31 @@ class ChannelAlarm:
     alarm_string = _read_only_property('alarm_string',
                                        doc='String associated with alarm')
 
+    @property
+    def ackt(self):
+        'DBR_STSACK_STRING.ackt: must_acknowledge_transient as 0 or 1'
+        return 1 if self._data['must_acknowledge_transient'] else 0
+
+    @property
+    def acks(self):
+        'DBR_STSACK_STRING.acks: alias for severity_to_acknowledge'
+        return self._data['severity_to_acknowledge']
+
     def __repr__(self):
         return f'<ChannelAlarm(status={self.status}, severity={self.severity})>'
 
     def connect(self, channel_data):
         """Add a ChannelData instance to the channel set using this alarm."""
-        self._channels.add(channel_data)
+        self._channels.append(weakref.ref(channel_data, self._channel_died))
 
     def disconnect(self, channel_data):
         """Remove ChannelData instance from channel set using this alarm."""
-        self._channels.remove(channel_data)
+        self._channels = [ref for ref in self._channels
+                          if ref() is not None and ref() is not channel_data]
+        self._dead_channels = 0
+
+    def _channel_died(self, ref):
+        self._dead_channels += 1
 
     async def read(self, dbr=None):
         """Read alarm information into a DBR_STSACK_STRING instance."""
@@ -146,9 +276,13 @@ class ChannelAlarm:
             dbr = DBR_STSACK_STRING()
         dbr.status = self.status
         dbr.severity = self.severity
-        dbr.ackt = 1 if self.must_acknowledge_transient else 0
-        dbr.acks = self.severity_to_acknowledge
-        dbr.value = self.alarm_string.encode(self.string_encoding)
+        dbr.ackt = self.ackt
+        dbr.acks = self.acks
+        encoded = self._alarm_string_bytes
+        if encoded is None:
+            encoded = self._alarm_string_bytes = self.alarm_string.encode(
+                self.string_encoding)
+        dbr.value = encoded
         return dbr
 
     async def write(self, *, status=None, severity=None,
@@ -210,8 +344,15 @@ class ChannelAlarm:
 
         if alarm_string is not None:
             data['alarm_string'] = alarm_string
+            self._alarm_string_bytes = None
             flags |= SubscriptionType.DBE_ALARM
 
+        # Alarm scalars are captured in channel snapshots; invalidate them.
+        for ref in self._channels:
+            channel = ref()
+            if channel is not None:
+                channel._snapshot_cache = None
+
         if publish:
             await self.publish(flags)
 
@@ -227,10 +368,16 @@ class ChannelAlarm:
             Skip publishing to these channels, mainly to avoid recursion.
         """
         except_for = except_for or ()
-        for channel in self._channels:
-            if channel not in except_for:
+        for ref in self._channels:
+            channel = ref()
+            if channel is not None and channel not in except_for:
                 await channel.publish(flags)
 
+        if self._dead_channels > len(self._channels) // 4:
+            self._channels = [ref for ref in self._channels
+                              if ref() is not None]
+            self._dead_channels = 0
+
 
 class ChannelData:
     """
@@ -257,6 +404,12 @@ class ChannelData:
     data_type = ChannelType.LONG
     _compatible_array_types = {}
 
+    __slots__ = ('_alarm', '_status', '_severity', '_max_length',
+                 'string_encoding', 'reported_record_type', '_data',
+                 '_queues', '_flat_queues', '_content', '_limits_cache',
+                 '_snapshots', '_fill_at_next_write', '_snapshot_cache',
+                 '__weakref__')
+
     def __init__(self, *, alarm=None, value=None, timestamp=None,
                  max_length=None, string_encoding='latin-1',
                  reported_record_type='caproto'):
@@ -290,24 +443,36 @@ class ChannelData:
             value=value,
             timestamp=TimeStamp.from_flexible_value(timestamp),
         )
-        # This is a dict keyed on queues that will receive subscription
-        # updates.  (Each queue belongs to a Context.) Each value is itself a
-        # dict, mapping data_types to the set of SubscriptionSpecs that request
-        # that data_type.
-        self._queues = defaultdict(
-            lambda: defaultdict(
-                lambda: defaultdict(set)))
-
-        # Cache results of data_type conversions. This maps data_type to
-        # (metdata, value). This is cleared each time publish() is called.
+        # This maps (queue, sync channel filter, data_type_name) to the set of
+        # SubscriptionSpecs that request that combination. (Each queue belongs
+        # to a Context that will receive subscription updates.)
+        self._queues = {}
+        # Derived (queue, sync, data_type, sub_specs) view of the above,
+        # rebuilt lazily by publish() after a new combination is subscribed.
+        self._flat_queues = None
+
+        # Cache results of data_type conversions. This maps _type_index to
+        # (metadata, value). This is cleared each time publish() is called,
+        # so its footprint is bounded by the distinct data types current
+        # subscribers request -- no eviction policy is needed.
         self._content = {}
-        self._snapshots = defaultdict(dict)
-        self._fill_at_next_write = list()
+        # Graphic/control limit values converted per requested ChannelType,
+        # valid until write_metadata changes a limit (which rebinds this to a
+        # fresh dict, leaving snapshots that share the old one untouched).
+        self._limits_cache = {}
+        # State-filter bookkeeping, created on first use: most PVs are never
+        # targeted by a sync channel filter, so do not pay for these per
+        # instance. Both are None until pre_state_change runs.
+        self._snapshots = None
+        self._fill_at_next_write = None
+        # Memoized result of _snapshot(), invalidated whenever the value,
+        # metadata, or alarm changes, so that several states flipping in
+        # close succession share one snapshot.
+        self._snapshot_cache = None
 
     def calculate_length(self, value):
         'Calculate the number of elements given a value'
-        is_array = isinstance(value, (list, tuple) + backend.array_types)
-        if is_array:
+        if isinstance(value, backend.sequence_types):
             return len(value)
         if isinstance(value, (bytes, str, bytearray)):
             if self.data_type == ChannelType.CHAR:
@@ -336,7 +501,14 @@ class ChannelData:
         ------
         CaprotoValueError
         '''
-        is_array = isinstance(value, (list, tuple) + backend.array_types)
+        is_array = type(value) in backend.array_types
+        if is_array:
+            if self._max_length > 1 and len(value) <= self._max_length:
+                # Fast path: an exact backend array type on an array channel
+                # is already in canonical form.
+                return value
+        else:
+            is_array = isinstance(value, backend.sequence_types)
         if is_array:
             if len(value) > self._max_length:
                 # TODO consider an exception for caproto-only environments that
@@ -359,6 +531,10 @@ class ChannelData:
             return [value]
         return value
 
+    # _data keys to include as keywords in __getnewargs_ex__; subclasses
+    # extend this tuple rather than overriding the method.
+    _newargs_data_keys = ()
+
     def __getnewargs_ex__(self):
         # ref: https://docs.python.org/3/library/pickle.html
         kwargs = {
@@ -369,8 +545,41 @@ class ChannelData:
             'data': self._data,
             'max_length': self._max_length
         }
+        data = self._data
+        for key in self._newargs_data_keys:
+            kwargs[key] = data[key]
         return ((), kwargs)
 
+    def __deepcopy__(self, memo):
+        """
+        A purpose-built deep copy: the data dict, the value, and the alarm
+        are copied, while subscription and snapshot bookkeeping start out
+        fresh.
+
+        This sidesteps :func:`copy.deepcopy`'s generic reduce path, which
+        would walk every slot -- including the alarm's weakref channel
+        list -- through the memo dict.
+        """
+        new = copy.copy(self)
+        memo[id(self)] = new
+        new._data = dict(self._data)
+        value = new._data['value']
+        if isinstance(value, backend.array_types):
+            new._data['value'] = copy.copy(value)
+        new._queues = {}
+        new._flat_queues = None
+        new._content = {}
+        new._limits_cache = {}
+        new._snapshots = None
+        new._fill_at_next_write = None
+        new._snapshot_cache = None
+        # Attach a copy of the alarm by way of the setter, so that the new
+        # channel is registered with it.
+        _, alarm_kwargs = self._alarm.__getnewargs_ex__()
+        new._alarm = None
+        new.alarm = ChannelAlarm(**alarm_kwargs)
+        return new
+
     value = _read_only_property('value')
 
     # "before" — only the last value received before the state changes from
@@ -384,29 +593,69 @@ class ChannelData:
     #     to false is forwarded to the client.
     # "unless" — values are forwarded to the client as long as the state is
     #     false.
+    _sync_filter_modes = ('before', 'first', 'while', 'last', 'after',
+                          'unless')
+
+    def _snapshot(self):
+        """
+        A frozen copy of this channel's data, for the sync channel filters.
+
+        Only what the publish/_read path consumes is copied -- the data dict,
+        the current value, and the alarm scalars -- rather than deep-copying
+        the whole instance along with its subscription bookkeeping.
+        """
+        cached = self._snapshot_cache
+        if cached is not None:
+            return cached
+        snapshot = copy.copy(self)
+        _, alarm_kwargs = self._alarm.__getnewargs_ex__()
+        snapshot._alarm = ChannelAlarm(**alarm_kwargs)
+        snapshot._data = dict(self._data)
+        snapshot._content = {}
+        value = snapshot._data['value']
+        if (isinstance(value, backend.array_types) and
+                not is_array_read_only(value)):
+            # Guard against in-place mutation of the live array. The copy is a
+            # single C-level memcpy for both backends. A preallocated,
+            # buffer reused across transitions would avoid the allocation, but
+            # snapshots outlive the transition that created them: they stay in
+            # self._snapshots (serving sync subscribers) until replaced, so
+            # their value arrays cannot share storage.
+            snapshot._data['value'] = copy.copy(value)
+        snapshot._snapshot_cache = None
+        self._snapshot_cache = snapshot
+        return snapshot
 
     def pre_state_change(self, state, new_value):
         "This is called by the server when it enters its StateUpdateContext."
-        snapshots = self._snapshots[state]
-        snapshots.clear()
-        snapshot = copy.deepcopy(self)
+        snapshots = self._snapshots
+        if snapshots is None:
+            snapshots = self._snapshots = {}
+            self._fill_at_next_write = []
+        else:
+            for mode in self._sync_filter_modes:
+                snapshots.pop((state, mode), None)
+        snapshot = self._snapshot()
         if new_value:
             # We are changing from false to true.
-            snapshots['before'] = snapshot
+            snapshots[(state, 'before')] = snapshot
         else:
             # We are changing from true to false.
-            snapshots['last'] = snapshot
+            snapshots[(state, 'last')] = snapshot
 
     def post_state_change(self, state, new_value):
         "This is called by the server when it exits its StateUpdateContext."
-        snapshots = self._snapshots[state]
+        snapshots = self._snapshots
+        if snapshots is None:
+            snapshots = self._snapshots = {}
+            self._fill_at_next_write = []
         if new_value:
             # We have changed from false to true.
-            snapshots['while'] = self
+            snapshots[(state, 'while')] = self
             self._fill_at_next_write.append((state, 'after'))
         else:
             # We have changed from true to false.
-            snapshots['unless'] = self
+            snapshots[(state, 'unless')] = self
             self._fill_at_next_write.append((state, 'first'))
 
     @property
@@ -440,19 +689,27 @@ class ChannelData:
         sub : Subscription
             The subscription instance.
         """
-        by_sync = self._queues[queue][sub_spec.channel_filter.sync]
-        by_sync[sub_spec.data_type_name].add(sub_spec)
-
-        # Always send current reading immediately upon subscription.
+        key = (queue, sub_spec.channel_filter.sync, sub_spec.data_type_name)
         try:
-            metadata, values = self._content[sub_spec.data_type_name]
+            self._queues[key].add(sub_spec)
         except KeyError:
+            self._queues[key] = {sub_spec}
+            # The sub_specs sets above are shared with the flattened view, so
+            # it only goes stale when a new combination appears.
+            self._flat_queues = None
+
+        # Always send current reading immediately upon subscription.
+        data_type = _channel_type_by_name[sub_spec.data_type_name]
+        type_index = _type_index(data_type)
+        entry = self._content.get(type_index)
+        if entry is None:
             # Do the expensive data type conversion and cache it in case
             # a future subscription wants the same data type.
-            data_type = _channel_type_by_name[sub_spec.data_type_name]
-            metadata, values = await self._read(data_type)
-            self._content[sub_spec.data_type_name] = metadata, values
-        await queue.put(SubscriptionUpdate((sub_spec,), metadata, values, 0, sub))
+            entry = await self._read(data_type)
+            self._content[type_index] = entry
+        metadata, values = entry
+        await queue.put((SubscriptionUpdate((sub_spec,), metadata, values,
+                                            0, sub),))
 
     async def unsubscribe(self, queue, sub_spec):
         """
@@ -465,8 +722,10 @@ class ChannelData:
         sub_spec : SubscriptionSpec
             The subscription specification.
         """
-        by_sync = self._queues[queue][sub_spec.channel_filter.sync]
-        by_sync[sub_spec.data_type_name].discard(sub_spec)
+        key = (queue, sub_spec.channel_filter.sync, sub_spec.data_type_name)
+        sub_specs = self._queues.get(key)
+        if sub_specs is not None:
+            sub_specs.discard(sub_spec)
 
     async def auth_read(self, hostname, username, data_type, *,
                         user_address=None):
@@ -509,11 +768,9 @@ class ChannelData:
             class_name.value = rtyp
             return class_name, b''
 
-        if data_type in _LongStringChannelType:
-            native_to = _LongStringChannelType.LONG_STRING
-            data_type = ChannelType(data_type)
-        else:
-            native_to = native_type(data_type)
+        (native_to, data_type, is_native,
+         dbr_class, alarm_fields) = _conversion_info_by_index[
+             _type_index(data_type)]
 
         values = backend.convert_values(
             values=self._data['value'],
@@ -525,17 +782,16 @@ class ChannelData:
         )
 
         # for native types, there is no dbr metadata - just data
-        if data_type in native_types:
+        if is_native:
             return b'', values
 
-        dbr_metadata = DBR_TYPES[data_type]()
+        dbr_metadata = dbr_class()
         self._read_metadata(dbr_metadata)
 
         # Copy alarm fields also.
-        alarm_dbr = await self.alarm.read()
-        for field, _ in alarm_dbr._fields_:
-            if hasattr(dbr_metadata, field):
-                setattr(dbr_metadata, field, getattr(alarm_dbr, field))
+        alarm = self._alarm
+        for field in alarm_fields:
+            setattr(dbr_metadata, field, getattr(alarm, field))
 
         return dbr_metadata, values
 
@@ -720,38 +976,53 @@ class ChannelData:
                                    )
             raise
         finally:
-            alarm_md = self._collect_alarm()
+            alarm_status, alarm_severity = self._collect_alarm()
 
         if modified_value is SkipWrite:
             # An alternative to raising SkipWrite: avoid the rest of this
             # method.
             return
 
+        new = modified_value if modified_value is not None else value
+
+        if (not metadata and alarm_status is None and
+                alarm_severity is None and not self._fill_at_next_write):
+            # Fast path for the common streaming write: no caller metadata,
+            # no alarm change from verification, and no state-filter snapshot
+            # pending. Equivalent to the general path below with an empty
+            # metadata dict, minus the write_metadata keyword sweep.
+            self._data['value'] = new
+            self._data['timestamp'] = TimeStamp.from_flexible_value(time.time())
+            self._snapshot_cache = None
+            await self.publish(flags)
+            return
+
         # issues of over-riding user passed in data here!
-        metadata.update(alarm_md)
+        if alarm_status is not None:
+            metadata['status'] = alarm_status
+        if alarm_severity is not None:
+            metadata['severity'] = alarm_severity
         metadata.setdefault('timestamp', time.time())
 
         if self._fill_at_next_write:
-            snapshot = copy.deepcopy(self)
-            for state, mode in self._fill_at_next_write:
-                self._snapshots[state][mode] = snapshot
+            snapshot = self._snapshot()
+            for key in self._fill_at_next_write:
+                self._snapshots[key] = snapshot
             self._fill_at_next_write.clear()
 
-        new = modified_value if modified_value is not None else value
-
         # TODO the next 5 lines should be done in one move
         self._data['value'] = new
+        self._snapshot_cache = None
         await self.write_metadata(publish=False, **metadata)
         # Send a new event to subscribers.
         await self.publish(flags)
-        # and publish any linked alarms
-        if 'status' in metadata or 'severity' in metadata:
+        # and publish any linked alarms. If this channel is the only one
+        # connected to the alarm, the fan-out would be a no-op; skip the call
+        # rather than make the writer wait on it.
+        if ('status' in metadata or 'severity' in metadata) and \
+                len(self._alarm._channels) > 1:
             await self.alarm.publish(flags, except_for=(self,))
 
-    def _is_eligible(self, ss):
-        sync = ss.channel_filter.sync
-        return sync is None or sync.m in self._snapshots[sync.s]
-
     async def update_fields(self, value):
         """This is a hook for subclasses to update field instance data."""
 
@@ -772,82 +1043,128 @@ class ChannelData:
         # so we only want to do it if it's going to be used, and we only want
         # to do each conversion once. Clear the cache to start. This cache is
         # instance state so that self.subscribe can also use it.
-        self._content.clear()
-
-        for queue, syncs in self._queues.items():
+        if self._content:
+            self._content.clear()
+
+        flat_queues = self._flat_queues
+        if flat_queues is None:
+            # Resolve each data_type_name to its ChannelType and cache index
+            # up front; the sub_specs sets are shared with self._queues, so
+            # membership changes are picked up without a rebuild.
+            flat_queues = self._flat_queues = [
+                (queue, sync, _channel_type_by_name[data_type_name],
+                 _type_index(_channel_type_by_name[data_type_name]), sub_specs)
+                for (queue, sync, data_type_name), sub_specs
+                in self._queues.items()
+            ]
+
+        # Updates are batched per queue so that each receiving Context is
+        # woken once per publish rather than once per (sync, data_type)
+        # group.
+        pending = {}
+        for queue, sync, data_type, type_index, sub_specs in flat_queues:
             # queue belongs to a Context that is expecting to receive
-            # updates of the form (sub_specs, metadata, values).
-            # data_types is a dict grouping the sub_specs for this queue by
-            # their data_type.
-            for sync, data_types in syncs.items():
-                for data_type_name, sub_specs in data_types.items():
-                    eligible = tuple(ss for ss in sub_specs
-                                     if self._is_eligible(ss))
-                    if not eligible:
-                        continue
-                    if sync is None:
-                        channel_data = self
-                    else:
-                        try:
-                            channel_data = self._snapshots[sync.s][sync.m]
-                        except KeyError:
-                            continue
-                    try:
-                        metdata, values = self._content[data_type_name]
-                    except KeyError:
-                        # Do the expensive data type conversion and cache it in
-                        # case another queue or a future subscription wants the
-                        # same data type.
-                        data_type = _channel_type_by_name[data_type_name]
-                        metadata, values = await channel_data._read(data_type)
-                        channel_data._content[data_type] = metadata, values
-
-                    # We will apply the array filter and deadband on the other side
-                    # of the queue, since each eligible SubscriptionSpec may
-                    # want a different slice. Sending the whole array through
-                    # the queue isn't any more expensive that sending a slice;
-                    # this is just a reference.
-                    await queue.put(SubscriptionUpdate(eligible, metadata, values, flags, None))
+            # batches of updates of the form (sub_specs, metadata, values).
+            # All sub_specs in this group share the same sync channel filter,
+            # so eligibility is decided once for the whole group.
+            if not sub_specs:
+                continue
+            if flags:
+                # Flag-free publishes (plain writes on the base class) are
+                # delivered unconditionally, as before.
+                for ss in sub_specs:
+                    if ss.mask & flags:
+                        break
+                else:
+                    # Nothing in this group asked for any of the event types
+                    # being published -- e.g. a DBE_PROPERTY-only update
+                    # going to value subscribers. Skip the conversion and
+                    # the wake-up.
+                    continue
+            if sync is None:
+                channel_data = self
+            elif self._snapshots is None:
+                continue
+            else:
+                try:
+                    channel_data = self._snapshots[sync.s, sync.m]
+                except KeyError:
+                    continue
+            entry = channel_data._content.get(type_index)
+            if entry is None:
+                # Do the expensive data type conversion and cache it in
+                # case another queue or a future subscription wants the
+                # same data type. The cache lives on channel_data, so all
+                # groups sharing a (sync, data_type) pair -- however many
+                # queues they fan out to -- convert exactly once per
+                # publish.
+                entry = await channel_data._read(data_type)
+                channel_data._content[type_index] = entry
+            metadata, values = entry
+
+            # We will apply the array filter and deadband on the other side
+            # of the queue, since each eligible SubscriptionSpec may
+            # want a different slice. Sending the whole array through
+            # the queue isn't any more expensive that sending a slice;
+            # this is just a reference.
+            update = SubscriptionUpdate(tuple(sub_specs), metadata, values,
+                                        flags, None)
+            try:
+                pending[queue].append(update)
+            except KeyError:
+                pending[queue] = [update]
+
+        for queue, updates in pending.items():
+            await queue.put(updates)
 
     def _read_metadata(self, dbr_metadata):
         """Fill the provided metadata instance with current metadata."""
-        to_type = ChannelType(dbr_metadata.DBR_ID)
+        (to_type, has_units, has_precision, has_stamp, native_to,
+         convert_attrs) = _metadata_info_by_dbr_class[type(dbr_metadata)]
         data = self._data
 
-        if hasattr(dbr_metadata, 'units'):
-            units = data.get('units', '')
-            if isinstance(units, str):
-                units = units.encode(self.string_encoding
-                                     if self.string_encoding
-                                     else 'latin-1')
+        if has_units:
+            units = data.get('units_encoded')
+            if units is None:
+                # Encode once per metadata write rather than once per DBR
+                # build; write_metadata drops the cached bytes when the
+                # units change.
+                units = data.get('units', '')
+                if isinstance(units, str):
+                    units = units.encode(self.string_encoding
+                                         if self.string_encoding
+                                         else 'latin-1')
+                data['units_encoded'] = units
             dbr_metadata.units = units
 
-        if hasattr(dbr_metadata, 'precision'):
+        if has_precision:
             dbr_metadata.precision = data.get('precision', 0)
 
-        if to_type in time_types:
-            dbr_metadata.stamp = self.epics_timestamp
-
-        convert_attrs = (GraphicControlBase.control_fields +
-                         GraphicControlBase.graphic_fields)
-
-        if any(hasattr(dbr_metadata, attr) for attr in convert_attrs):
-            # convert all metadata types to the target type
-            dt = (self.data_type
-                  if self.data_type != ChannelType.ENUM
-                  else ChannelType.INT)
-            values = backend.convert_values(
-                values=[data.get(key, 0) for key in convert_attrs],
-                from_dtype=dt,
-                to_dtype=native_type(to_type),
-                string_encoding=self.string_encoding,
-                direction=ConversionDirection.TO_WIRE,
-                auto_byteswap=False)
-            if isinstance(values, backend.array_types):
-                values = values.tolist()
+        if has_stamp:
+            # Assigning a Structure into a struct field copies it by value,
+            # so the defensive copy epics_timestamp makes is not needed here.
+            dbr_metadata.stamp = data['timestamp']
+
+        if convert_attrs:
+            values = self._limits_cache.get(to_type)
+            if values is None:
+                # convert all metadata types to the target type, caching the
+                # result until write_metadata changes a limit
+                dt = (self.data_type
+                      if self.data_type != ChannelType.ENUM
+                      else ChannelType.INT)
+                values = backend.convert_values(
+                    values=[data.get(key, 0) for key in convert_attrs],
+                    from_dtype=dt,
+                    to_dtype=native_to,
+                    string_encoding=self.string_encoding,
+                    direction=ConversionDirection.TO_WIRE,
+                    auto_byteswap=False)
+                if isinstance(values, backend.array_types):
+                    values = values.tolist()
+                self._limits_cache[to_type] = values
             for attr, value in zip(convert_attrs, values):
-                if hasattr(dbr_metadata, attr):
-                    setattr(dbr_metadata, attr, value)
+                setattr(dbr_metadata, attr, value)
 
     async def write_metadata(self, publish=True, units=None, precision=None,
                              timestamp=None, upper_disp_limit=None,
@@ -892,13 +1209,19 @@ class ChannelData:
         severity : AlarmSeverity, optional
             Updated alarm severity.
         """
+        self._snapshot_cache = None
         data = self._data
-        for kw in ('units', 'precision', 'upper_disp_limit',
-                   'lower_disp_limit', 'upper_alarm_limit',
-                   'upper_warning_limit', 'lower_warning_limit',
-                   'lower_alarm_limit', 'upper_ctrl_limit',
-                   'lower_ctrl_limit'):
-            value = locals()[kw]
+        limits_changed = False
+        for kw, value in (('units', units),
+                          ('precision', precision),
+                          ('upper_disp_limit', upper_disp_limit),
+                          ('lower_disp_limit', lower_disp_limit),
+                          ('upper_alarm_limit', upper_alarm_limit),
+                          ('upper_warning_limit', upper_warning_limit),
+                          ('lower_warning_limit', lower_warning_limit),
+                          ('lower_alarm_limit', lower_alarm_limit),
+                          ('upper_ctrl_limit', upper_ctrl_limit),
+                          ('lower_ctrl_limit', lower_ctrl_limit)):
             if value is not None and kw in data:
                 # Unpack scalars. This could be skipped for numpy.ndarray which
                 # does the right thing, but is essential for array.array to
@@ -908,6 +1231,18 @@ class ChannelData:
                 except (TypeError, ValueError):
                     pass
                 data[kw] = value
+                if kw not in ('units', 'precision'):
+                    limits_changed = True
+
+        if units is not None:
+            # Invalidate the encoded form served by _read_metadata.
+            data.pop('units_encoded', None)
+
+        if limits_changed:
+            # The converted limit sets served by _read_metadata are stale.
+            # Rebind rather than clear: snapshots share the old dict and
+            # keep serving their frozen limits from it.
+            self._limits_cache = {}
 
         if timestamp is not None:
             self._data["timestamp"] = TimeStamp.from_flexible_value(timestamp)
@@ -952,17 +1287,15 @@ class ChannelData:
         self._severity = AlarmSeverity(value)
 
     def _collect_alarm(self):
-        out = {}
-        if self._status is not None and self._status != self.alarm.status:
-            out['status'] = self._status
-        if self._severity is not None and self._status != self.alarm.status:
-            out['severity'] = self._severity
+        status, severity = self._status, self._severity
+        alarm = self._alarm
+        if status is not None and status == alarm.status:
+            status = None
+        if severity is not None and severity == alarm.severity:
+            severity = None
 
-        self._clear_cached_alarms()
-        return out
-
-    def _clear_cached_alarms(self):
         self._status = self._severity = None
+        return status, severity
 
     def __len__(self):
         try:
@@ -1009,6 +1342,15 @@ class ChannelData:
         bool
             True if ``value`` is compatible, False otherwise.
         """
+        if np is not None and type(value) is np.ndarray:
+            # Fast path: probing __array_interface__ builds a fresh dict per
+            # call, while ndarray attributes answer the same questions.
+            return (
+                value.ndim == 1 and
+                value.flags.c_contiguous and
+                value.dtype.str in self._compatible_array_types
+            )
+
         interface = getattr(value, "__array_interface__", None)
         if interface is None:
             return False
@@ -1048,19 +1390,21 @@ class ChannelEnum(ChannelData):
     """
 
     data_type = ChannelType.ENUM
+    __slots__ = ()
 
     @staticmethod
     def _validate_enum_strings(enum_strings):
-        if any(len(es) >= MAX_ENUM_STRING_SIZE for es in enum_strings):
-            over_length = tuple(f'{es}: {len(es)}' for es in enum_strings if
-                                len(es) >= MAX_ENUM_STRING_SIZE)
+        enum_strings = tuple(enum_strings)
+        over_length = tuple(f'{es}: {len(es)}' for es in enum_strings
+                            if len(es) >= MAX_ENUM_STRING_SIZE)
+        if over_length:
             msg = (f"The maximum enum string length is {MAX_ENUM_STRING_SIZE} " +
                    f"but the strings {over_length} are too long")
             raise ValueError(msg)
         if len(enum_strings) > MAX_ENUM_STATES:
             raise ValueError(f"The maximum number of enum states is {MAX_ENUM_STATES} " +
                              f"but you passed in {len(enum_strings)}")
-        return tuple(enum_strings)
+        return enum_strings
 
     def __init__(self, *, enum_strings=None, **kwargs):
         super().__init__(**kwargs)
@@ -1073,20 +1417,21 @@ class ChannelEnum(ChannelData):
 
     def get_raw_value(self, value) -> int:
         """The raw integer value index of the provided enum string."""
-        try:
-            return self.enum_strings.index(value)
-        except ValueError:
-            return None
+        data = self._data
+        index = data.get('enum_strings_index')
+        if index is None:
+            # O(1) reverse lookup in place of a linear scan per query;
+            # write_metadata drops the mapping when the strings change.
+            index = data['enum_strings_index'] = {
+                es: i for i, es in enumerate(data['enum_strings'])}
+        return index.get(value)
 
     @property
     def raw_value(self) -> int:
         """The raw integer value index of the enum string."""
         return self.get_raw_value(self.value)
 
-    def __getnewargs_ex__(self):
-        args, kwargs = super().__getnewargs_ex__()
-        kwargs['enum_strings'] = self.enum_strings
-        return (args, kwargs)
+    _newargs_data_keys = ChannelData._newargs_data_keys + ('enum_strings',)
 
     async def verify_value(self, data):
         try:
@@ -1095,11 +1440,20 @@ class ChannelEnum(ChannelData):
             ...
         return data
 
+    _enum_string_dbr_types = (DBR_TYPES[ChannelType.GR_ENUM],
+                              DBR_TYPES[ChannelType.CTRL_ENUM])
+
     def _read_metadata(self, dbr_metadata):
-        if isinstance(dbr_metadata, (DBR_TYPES[ChannelType.GR_ENUM],
-                                     DBR_TYPES[ChannelType.CTRL_ENUM])):
-            dbr_metadata.enum_strings = [s.encode(self.string_encoding)
-                                         for s in self.enum_strings]
+        if isinstance(dbr_metadata, self._enum_string_dbr_types):
+            data = self._data
+            encoded = data.get('enum_strings_encoded')
+            if encoded is None:
+                # Encode once per enum_strings update rather than once per
+                # GR/CTRL read; write_metadata drops the cached list.
+                encoded = [s.encode(self.string_encoding)
+                           for s in self.enum_strings]
+                data['enum_strings_encoded'] = encoded
+            dbr_metadata.enum_strings = encoded
 
         return super()._read_metadata(dbr_metadata)
 
@@ -1114,6 +1468,8 @@ class ChannelEnum(ChannelData):
     async def write_metadata(self, enum_strings=None, **kwargs):
         if enum_strings is not None:
             self._data['enum_strings'] = self._validate_enum_strings(enum_strings)
+            self._data.pop('enum_strings_encoded', None)
+            self._data.pop('enum_strings_index', None)
 
         return await super().write_metadata(**kwargs)
 
@@ -1166,6 +1522,8 @@ class ChannelNumeric(ChannelData):
         Log tolerance value.
     """
 
+    __slots__ = ('value_atol', 'log_atol')
+
     def __init__(self, *, value, units='',
                  upper_disp_limit=0, lower_disp_limit=0,
                  upper_alarm_limit=0, upper_warning_limit=0,
@@ -1200,94 +1558,91 @@ class ChannelNumeric(ChannelData):
     upper_ctrl_limit = _read_only_property('upper_ctrl_limit')
     lower_ctrl_limit = _read_only_property('lower_ctrl_limit')
 
-    def __getnewargs_ex__(self):
-        args, kwargs = super().__getnewargs_ex__()
-        kwargs.update(
-            units=self.units,
-            upper_disp_limit=self.upper_disp_limit,
-            lower_disp_limit=self.lower_disp_limit,
-            upper_alarm_limit=self.upper_alarm_limit,
-            lower_alarm_limit=self.lower_alarm_limit,
-            upper_warning_limit=self.upper_warning_limit,
-            lower_warning_limit=self.lower_warning_limit,
-            upper_ctrl_limit=self.upper_ctrl_limit,
-            lower_ctrl_limit=self.lower_ctrl_limit,
-        )
-        return (args, kwargs)
+    _newargs_data_keys = ChannelData._newargs_data_keys + (
+        'units',
+        'upper_disp_limit', 'lower_disp_limit',
+        'upper_alarm_limit', 'lower_alarm_limit',
+        'upper_warning_limit', 'lower_warning_limit',
+        'upper_ctrl_limit', 'lower_ctrl_limit',
+    )
+
+    def _limit_severity(self, severity_attr, default_severity):
+        'Severity for a triggered limit, taking the field PV into account'
+        sev = default_severity
+        sev_prop = getattr(getattr(self, 'field_inst', None),
+                           severity_attr, None)
+        if sev_prop is not None:
+            # TODO sort out where ints are getting through...
+            if isinstance(sev_prop.value, str):
+                sev = sev_prop.enum_strings.index(sev_prop.value)
+        return AlarmSeverity(sev)
 
     async def verify_value(self, data):
-        if not isinstance(data, Iterable):
-            val = data
+        d = self._data
+        lower_ctrl = d['lower_ctrl_limit']
+        upper_ctrl = d['upper_ctrl_limit']
+        lolo = d['lower_alarm_limit']
+        hihi = d['upper_alarm_limit']
+        low = d['lower_warning_limit']
+        high = d['upper_warning_limit']
+        if lower_ctrl == upper_ctrl and lolo == hihi and low == high:
+            # No limits are configured (the common case); nothing to check.
+            self.status = AlarmStatus.NO_ALARM
+            self.severity = AlarmSeverity.NO_ALARM
+            return data
+
+        t = type(data)
+        if t is int or t is float:
+            # By far the most common write: a plain Python scalar. Checking
+            # the exact type skips the Iterable ABC machinery entirely.
+            lo = hi = data
+        elif not isinstance(data, Iterable):
+            lo = hi = data
+        elif len(data) == 0:
+            return data
         elif len(data) == 1:
-            val, = data
+            lo = hi = data[0]
         else:
-            # data is an array -- limits do not apply.
-            return data
-        if self.lower_ctrl_limit != self.upper_ctrl_limit:
-            if not self.lower_ctrl_limit <= val <= self.upper_ctrl_limit:
+            # One reduction pass bounds the whole array, so arrays get the
+            # same limit enforcement as scalars.  ndarray reductions run at
+            # C speed; the builtins cover the stdlib array backend.
+            try:
+                lo = data.min()
+                hi = data.max()
+            except AttributeError:
+                lo = min(data)
+                hi = max(data)
+
+        if lower_ctrl != upper_ctrl:
+            if lo < lower_ctrl or hi > upper_ctrl:
+                val = lo if lo < lower_ctrl else hi
                 raise CannotExceedLimits(
                     f"Cannot write data {val}. Limits are set to "
-                    f"{self.lower_ctrl_limit} and {self.upper_ctrl_limit}."
+                    f"{lower_ctrl} and {upper_ctrl}."
                 )
 
-        def limit_checker(
-                value,
-                lo_attr, hi_attr,
-                lo_status, hi_status,
-                lo_severity_attr,
-                hi_severity_attr,
-                dflt_lo_severity,
-                dflt_hi_severity):
-
-            def limit_getter(limit_attr, severity_attr, dflt_severity):
-                sev = dflt_severity
-                limit = getattr(self, limit_attr)
-
-                sev_prop = getattr(
-                    getattr(self, 'field_inst', None),
-                    severity_attr, None)
-                if sev_prop is not None:
-                    # TODO sort out where ints are getting through...
-                    if isinstance(sev_prop.value, str):
-                        sev = sev_prop.enum_strings.index(sev_prop.value)
-
-                return limit, AlarmSeverity(sev)
-
-            lo_limit, lo_severity = limit_getter(
-                lo_attr, lo_severity_attr, dflt_lo_severity)
-            hi_limit, hi_severity = limit_getter(
-                hi_attr, hi_severity_attr, dflt_hi_severity)
-            if lo_limit != hi_limit:
-                if value <= lo_limit:
-                    return lo_status, lo_severity
-
-                elif hi_limit <= value:
-                    return hi_status, hi_severity
-
-            return AlarmStatus.NO_ALARM, AlarmSeverity.NO_ALARM
-
+        asts = AlarmStatus.NO_ALARM
+        asver = AlarmSeverity.NO_ALARM
         # this is HIHI and LOLO limits
-        asts, asver = limit_checker(val,
-                                    'lower_alarm_limit',
-                                    'upper_alarm_limit',
-                                    AlarmStatus.LOLO,
-                                    AlarmStatus.HIHI,
-                                    'lolo_severity',
-                                    'hihi_severity',
-                                    AlarmSeverity.MAJOR_ALARM,
-                                    AlarmSeverity.MAJOR_ALARM)
+        if lolo != hihi:
+            if lo <= lolo:
+                asts = AlarmStatus.LOLO
+                asver = self._limit_severity('lolo_severity',
+                                             AlarmSeverity.MAJOR_ALARM)
+            elif hihi <= hi:
+                asts = AlarmStatus.HIHI
+                asver = self._limit_severity('hihi_severity',
+                                             AlarmSeverity.MAJOR_ALARM)
         # if HIHI and LOLO did not trigger as alarm, see if HIGH and LOW do
-        if asts is AlarmStatus.NO_ALARM:
-            # this is HIGH and LOW limits
-            asts, asver = limit_checker(val,
-                                        'lower_warning_limit',
-                                        'upper_warning_limit',
-                                        AlarmStatus.LOW,
-                                        AlarmStatus.HIGH,
-                                        'low_severity',
-                                        'high_severity',
-                                        AlarmSeverity.MINOR_ALARM,
-                                        AlarmSeverity.MINOR_ALARM)
+        if asts is AlarmStatus.NO_ALARM and low != high:
+            if lo <= low:
+                asts = AlarmStatus.LOW
+                asver = self._limit_severity('low_severity',
+                                             AlarmSeverity.MINOR_ALARM)
+            elif high <= hi:
+                asts = AlarmStatus.HIGH
+                asver = self._limit_severity('high_severity',
+                                             AlarmSeverity.MINOR_ALARM)
 
         self.status = asts
         self.severity = asver
@@ -1343,6 +1698,7 @@ class ChannelShort(ChannelNumeric):
         Log tolerance value.
     """
     data_type = ChannelType.INT
+    __slots__ = ()
 
 
 class ChannelInteger(ChannelNumeric):
@@ -1393,6 +1749,7 @@ class ChannelInteger(ChannelNumeric):
         Log tolerance value.
     """
     data_type = ChannelType.LONG
+    __slots__ = ()
 
 
 class ChannelFloat(ChannelNumeric):
@@ -1444,6 +1801,7 @@ class ChannelFloat(ChannelNumeric):
     """
 
     data_type = ChannelType.FLOAT
+    __slots__ = ()
 
     def __init__(self, *, precision=0, **kwargs):
         super().__init__(**kwargs)
@@ -1451,10 +1809,7 @@ class ChannelFloat(ChannelNumeric):
 
     precision = _read_only_property('precision')
 
-    def __getnewargs_ex__(self):
-        args, kwargs = super().__getnewargs_ex__()
-        kwargs['precision'] = self.precision
-        return (args, kwargs)
+    _newargs_data_keys = ChannelNumeric._newargs_data_keys + ('precision',)
 
 
 class ChannelDouble(ChannelNumeric):
@@ -1505,6 +1860,7 @@ class ChannelDouble(ChannelNumeric):
         Log tolerance value.
     """
     data_type = ChannelType.DOUBLE
+    __slots__ = ()
 
     def __init__(self, *, precision=0, **kwargs):
         super().__init__(**kwargs)
@@ -1513,10 +1869,7 @@ class ChannelDouble(ChannelNumeric):
 
     precision = _read_only_property('precision')
 
-    def __getnewargs_ex__(self):
-        args, kwargs = super().__getnewargs_ex__()
-        kwargs['precision'] = self.precision
-        return (args, kwargs)
+    _newargs_data_keys = ChannelNumeric._newargs_data_keys + ('precision',)
 
 
 class ChannelByte(ChannelNumeric):
@@ -1570,6 +1923,7 @@ class ChannelByte(ChannelNumeric):
     # 'Limits' on chars do not make much sense and are rarely used.
     data_type = ChannelType.CHAR
     _compatible_array_types = {'|u1', '|i1', '|b1'}
+    __slots__ = ('strip_null_terminator',)
 
     def __init__(self, *, string_encoding=None, strip_null_terminator=True,
                  **kwargs):
@@ -1580,29 +1934,54 @@ class ChannelByte(ChannelNumeric):
         super().__init__(string_encoding=None, **kwargs)
 
     def preprocess_value(self, value):
+        if (self.is_compatible_array(value) and self._max_length > 1 and
+                len(value) <= self._max_length):
+            # Combined fast path, with the same bounds as the base class's
+            # canonical-form check: compatible in-bounds arrays skip the
+            # second walk through super().preprocess_value entirely.
+            if not is_array_read_only(value):
+                if np is not None and type(value) is np.ndarray:
+                    value = value.view()
+                    value.flags.writeable = False
+                else:
+                    value = copy.copy(value)
+            return value
+
         value = super().preprocess_value(value)
 
         if self.is_compatible_array(value):
             if not is_array_read_only(value):
-                value = copy.copy(value)
+                if np is not None and type(value) is np.ndarray:
+                    # Alias the caller's buffer through a read-only view
+                    # rather than copying image-sized payloads on every
+                    # write. The caller must not mutate the array after
+                    # handing it over.
+                    value = value.view()
+                    value.flags.writeable = False
+                else:
+                    value = copy.copy(value)
             if self.max_length == 1:
                 return value[0]
             return value
 
-        if isinstance(value, (list, tuple) + backend.array_types):
+        if isinstance(value, backend.sequence_types):
             if not len(value):
                 return b''
             elif len(value) == 1:
                 value = value[0]
             else:
-                value = b''.join(map(bytes, ([v] for v in value)))
+                # One contiguous allocation from the full sequence of ints,
+                # rather than a length-1 bytes object per element.
+                if not isinstance(value, (list, tuple)):
+                    value = list(value)
+                value = bytes(value)
 
         if self.max_length == 1:
             try:
                 len(value)
             except TypeError:
                 # Allow a scalar byte value to be passed in
-                value = bytes([value])
+                value = _scalar_byte(value)
 
         if isinstance(value, str):
             raise CaprotoValueError('ChannelByte does not accept decoded strings')
@@ -1610,7 +1989,10 @@ class ChannelByte(ChannelNumeric):
         if self.strip_null_terminator:
             if not isinstance(value, bytes):
                 value = value.tobytes()
-            value = value.rstrip(b'\x00')
+            # Most payloads have no trailing null; checking the last byte
+            # skips the rstrip call entirely in that case.
+            if value and value[-1] == 0:
+                value = value.rstrip(b'\x00')
 
         return value
 
@@ -1647,52 +2029,75 @@ class ChannelChar(ChannelData):
     """
     data_type = ChannelType.CHAR
     _compatible_array_types = {'|u1', '|i1', '|b1'}
+    # No __slots__ here: report_as_string shadows the class-level data_type
+    # with an instance attribute, which requires a __dict__.
 
     def __init__(self, *, alarm=None, value=None, timestamp=None,
                  max_length=None, string_encoding='latin-1',
                  reported_record_type='caproto', report_as_string=False):
+        # Fixed for the channel's lifetime; checked per write in max_length.
+        # False during the initial-value preprocess below, matching the
+        # class-level CHAR data_type it sees.
+        self._report_as_string = False
         super().__init__(alarm=alarm, value=value, timestamp=timestamp,
                          max_length=max_length,
                          string_encoding=string_encoding,
                          reported_record_type=reported_record_type)
 
         if report_as_string:
+            self._report_as_string = True
             self.data_type = ChannelType.STRING
 
     @property
     def long_string_max_length(self):
         'The maximum number of elements (length) of the current value'
-        return super().max_length
+        return self._max_length
 
     @property
     def max_length(self):
         'The number of elements (length) of the current value'
-        if self.data_type == ChannelType.STRING:
+        if self._report_as_string:
             return 1
-        return super().max_length
+        return self._max_length
 
     def preprocess_value(self, value):
+        if (self.is_compatible_array(value) and self._max_length > 1 and
+                len(value) <= self._max_length):
+            # Combined fast path, with the same bounds as the base class's
+            # canonical-form check. Decode straight from the array's buffer,
+            # skipping both the second walk through super().preprocess_value
+            # and the intermediate tobytes() copy.
+            return str(memoryview(value), self.string_encoding)
+
         value = super().preprocess_value(value)
 
         if self.is_compatible_array(value):
-            value = value.tobytes()
-        elif isinstance(value, (list, tuple) + backend.array_types):
+            # Decode straight from the array's buffer, skipping the
+            # intermediate tobytes() copy.
+            value = str(memoryview(value), self.string_encoding)
+        elif isinstance(value, backend.sequence_types):
             if not len(value):
                 value = b''
             elif len(value) == 1:
                 value = value[0]
             else:
-                value = b''.join(map(bytes, ([v] for v in value)))
+                # One contiguous allocation from the full sequence of ints,
+                # rather than a length-1 bytes object per element.
+                if not isinstance(value, (list, tuple)):
+                    value = list(value)
+                value = bytes(value)
 
         if self.max_length == 1:
             try:
                 len(value)
             except TypeError:
                 # Allow a scalar byte value to be passed in
-                value = str(bytes([value]), self.string_encoding)
+                value = str(_scalar_byte(value), self.string_encoding)
 
         if isinstance(value, bytes):
-            value = value.decode(self.string_encoding)
+            # decode() with a common codec name ('latin-1', 'utf-8',
+            # 'ascii') dispatches straight to CPython's dedicated C loop.
+            return value.decode(self.string_encoding)
 
         if not isinstance(value, str):
             raise CaprotoValueError('Invalid string')
@@ -1739,6 +2144,7 @@ class ChannelString(ChannelData):
         record or be set to something arbitrary.  Defaults to 'caproto'.
     """
     data_type = ChannelType.STRING
+    __slots__ = ('_long_string_max_length',)
 
     def __init__(self, *, alarm=None, value=None, timestamp=None,
                  max_length=None, string_encoding='latin-1',
@@ -9,6 +9,7 @@ import collections
 import ctypes
 import datetime
 import logging
+import math
 import numbers
 import time
 from enum import IntEnum, IntFlag
@@ -1152,6 +1153,15 @@ def epics_timestamp_to_unix(seconds_since_epoch, nano_seconds):
 def timestamp_to_epics(ts):
     '''Python timestamp from EPICS TimeStamp structure'''
     if isinstance(ts, numbers.Real):
-        ts = datetime.datetime.utcfromtimestamp(ts)
+        # Split the float directly instead of round-tripping through
+        # datetime; this runs on every timestamped write.
+        nano, sec = math.modf(ts - EPICS2UNIX_EPOCH)
+        if nano < 0:
+            # Pre-EPICS-epoch timestamps split into a negative fraction;
+            # normalize so nanoseconds stays in [0, 1e9) and cannot wrap
+            # in the uint32 TimeStamp.nanoSeconds field.
+            sec -= 1
+            nano += 1
+        return int(sec), int(nano * 1e9)
     dt = ts - EPICS_EPOCH
     return int(dt.total_seconds()), int(dt.microseconds * 1e3)
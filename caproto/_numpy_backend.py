@@ -61,7 +61,12 @@ def python_to_epics(dtype, values, *, byteswap=True, convert_from=None):
             assert len(values) == 1, "expected b'...', [b'...'], or [...]"
             return values[0]
 
-    return np.asarray(values).astype(type_map[dtype])
+    dt = type_map[dtype]
+    if isinstance(values, np.ndarray):
+        # astype(copy=False) hands back the same array when it is already in
+        # the (big-endian) wire dtype, skipping a full-array cast + copy.
+        return values.astype(dt, copy=False)
+    return np.asarray(values).astype(dt)
 
 
 def _setup():
@@ -4,6 +4,7 @@ import inspect
 import socket
 import sys
 import threading
+import weakref
 
 import caproto as ca
 
@@ -30,6 +31,9 @@ class AsyncioQueue:
     async def async_put(self, value):
         return await self._queue.put(value)
 
+    def get_nowait(self):
+        return self._queue.get_nowait()
+
     def get(self):
         future = asyncio.run_coroutine_threadsafe(
             self._queue.get(), self._loop)
@@ -37,6 +41,21 @@ class AsyncioQueue:
         return future.result()
 
     def put(self, value):
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self._loop:
+            # Already in the bound loop: enqueue directly, skipping the
+            # concurrent.futures.Future + call_soon_threadsafe round-trip.
+            try:
+                self._queue.put_nowait(value)
+                return
+            except asyncio.QueueFull:
+                # Fall through to the scheduled put, which waits for space.
+                ...
+
         asyncio.run_coroutine_threadsafe(
             self._queue.put(value), self._loop)
 
@@ -189,7 +208,10 @@ class _TaskHandler:
 
     async def cancel(self, task):
         task.cancel()
-        await task
+        try:
+            await task
+        except asyncio.CancelledError:
+            ...
 
     async def cancel_all(self, wait=False):
         with self._lock:
@@ -209,10 +231,39 @@ class _CallbackExecutor:
         self.tasks = _TaskHandler()
         self.tasks.create(self._callback_loop())
         self.log = log
+        # iscoroutinefunction results, weakly keyed so entries vanish with
+        # their callbacks.  A plain id()-keyed dict could go stale when ids
+        # are reused after garbage collection.
+        self._is_coroutine_cache = weakref.WeakKeyDictionary()
+
+    def _is_coroutine_callback(self, callback):
+        cache = self._is_coroutine_cache
+        try:
+            return cache[callback]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable or non-weakrefable callback; check it each time.
+            return inspect.iscoroutinefunction(callback)
+
+        is_coroutine = inspect.iscoroutinefunction(callback)
+        try:
+            cache[callback] = is_coroutine
+        except TypeError:
+            pass
+        return is_coroutine
 
     async def shutdown(self):
         await self.tasks.cancel_all()
 
+    def _log_callback_exception(self, future):
+        # Exceptions from threaded callbacks surface on the executor future,
+        # not in the submission try/except.
+        if not future.cancelled():
+            ex = future.exception()
+            if ex is not None:
+                self.log.error('Callback failure', exc_info=ex)
+
     async def _callback_loop(self):
         loop = get_running_loop()
         # self.user_callback_executor = concurrent.futures.ThreadPoolExecutor(
@@ -221,18 +272,36 @@ class _CallbackExecutor:
         # )
 
         while True:
-            callback, args, kwargs = await self.callbacks.async_get()
-            if inspect.iscoroutinefunction(callback):
-                try:
-                    await callback(*args, **kwargs)
-                except Exception:
-                    self.log.exception('Callback failure')
-            else:
+            batch = [await self.callbacks.async_get()]
+            # Drain whatever else is already queued, so that a burst of
+            # callbacks pays for one await rather than one per callback.
+            while True:
                 try:
-                    loop.run_in_executor(None, functools.partial(callback, *args,
-                                                                 **kwargs))
-                except Exception:
-                    self.log.exception('Callback failure')
+                    batch.append(self.callbacks.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            for callback, args, kwargs in batch:
+                if self._is_coroutine_callback(callback):
+                    try:
+                        await callback(*args, **kwargs)
+                    except Exception:
+                        self.log.exception('Callback failure')
+                else:
+                    try:
+                        if kwargs:
+                            future = loop.run_in_executor(
+                                None, functools.partial(callback, *args,
+                                                        **kwargs))
+                        else:
+                            # run_in_executor passes positional arguments
+                            # itself; no partial allocation needed.
+                            future = loop.run_in_executor(None, callback,
+                                                          *args)
+                    except Exception:
+                        self.log.exception('Callback failure')
+                    else:
+                        future.add_done_callback(self._log_callback_exception)
 
     def submit(self, callback, *args, **kwargs):
         self.callbacks.put((callback, args, kwargs))
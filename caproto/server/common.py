@@ -874,11 +874,14 @@ class Context:
         Coroutine which evaluates one item from the circuit command queue.
         """
         while True:
-            # This queue receives updates that match the db_entry, data_type
-            # and mask ("subscription spec") of one or more subscriptions.
-            sub_specs, metadata, values, flags, sub = await self.subscription_queue.get()
-            await self._subscription_queue_iteration(sub_specs, metadata,
-                                                     values, flags, sub)
+            # This queue receives batches of updates that match the db_entry,
+            # data_type and mask ("subscription spec") of one or more
+            # subscriptions. Updates from a single publish arrive coalesced
+            # into one batch per queue.
+            batch = await self.subscription_queue.get()
+            for sub_specs, metadata, values, flags, sub in batch:
+                await self._subscription_queue_iteration(sub_specs, metadata,
+                                                         values, flags, sub)
 
     async def _subscription_queue_iteration(self, sub_specs, metadata, values,
                                             flags, sub):
@@ -940,16 +943,17 @@ class Context:
                         if new_iterable:
                             new, = new
                         # Cool that was fun.
+                        abs_diff = abs(old - new)
                         if dbnd.m == 'rel':
-                            out_of_band = dbnd.d < abs((old - new) / old)
+                            out_of_band = dbnd.d < abs_diff / abs(old)
                         else:  # must be 'abs' -- was already validated
-                            out_of_band = dbnd.d < abs(old - new)
+                            out_of_band = dbnd.d < abs_diff
                         # We have verified that that EPICS considers DBE_LOG
                         # etc. to be an absolute (not relative) threshold.
-                        abs_diff = abs(old - new)
-                        if abs_diff > sub.db_entry.log_atol:
+                        db_entry = sub.db_entry
+                        if abs_diff > db_entry.log_atol:
                             s_flags |= SubscriptionType.DBE_LOG
-                            if abs_diff > sub.db_entry.value_atol:
+                            if abs_diff > db_entry.value_atol:
                                 s_flags |= SubscriptionType.DBE_VALUE
 
                         if not (out_of_band and (sub.mask & s_flags)):
@@ -369,6 +369,90 @@ def test_data_copy(cls, kwargs):
     assert args1 == args2
 
 
+def test_alarm_severity_returns_to_normal():
+    async def test():
+        data = ca.ChannelDouble(value=0.0,
+                                upper_alarm_limit=10, lower_alarm_limit=-10,
+                                upper_warning_limit=5, lower_warning_limit=-5)
+        await data.write(12.0)
+        assert data.alarm.status == ca.AlarmStatus.HIHI
+        assert data.alarm.severity == ca.AlarmSeverity.MAJOR_ALARM
+
+        # Falling back into the warning band must lower the severity...
+        await data.write(6.0)
+        assert data.alarm.status == ca.AlarmStatus.HIGH
+        assert data.alarm.severity == ca.AlarmSeverity.MINOR_ALARM
+
+        # ... and returning to the normal band must clear it entirely.
+        await data.write(0.0)
+        assert data.alarm.status == ca.AlarmStatus.NO_ALARM
+        assert data.alarm.severity == ca.AlarmSeverity.NO_ALARM
+
+    asyncio.get_event_loop().run_until_complete(test())
+
+
+def test_subscription_mask_filters_publish():
+    from caproto.server.common import SubscriptionSpec
+
+    class Queue:
+        def __init__(self):
+            self.items = []
+
+        async def put(self, item):
+            self.items.append(item)
+
+    async def test():
+        data = ca.ChannelDouble(value=0.0)
+        no_filter = ca.ChannelFilter(ts=False, dbnd=None, sync=None, arr=None)
+        value_queue = Queue()
+        value_spec = SubscriptionSpec(
+            db_entry=data, data_type_name='DOUBLE',
+            mask=ca.SubscriptionType.DBE_VALUE | ca.SubscriptionType.DBE_ALARM,
+            channel_filter=no_filter)
+        property_queue = Queue()
+        property_spec = SubscriptionSpec(
+            db_entry=data, data_type_name='DOUBLE',
+            mask=ca.SubscriptionType.DBE_PROPERTY,
+            channel_filter=no_filter)
+        await data.subscribe(value_queue, value_spec, None)
+        await data.subscribe(property_queue, property_spec, None)
+        # Both queues received the initial update on subscription.
+        assert len(value_queue.items) == 1
+        assert len(property_queue.items) == 1
+
+        # An alarm-flagged publish only reaches the subscription whose mask
+        # includes DBE_ALARM.
+        await data.publish(ca.SubscriptionType.DBE_ALARM)
+        assert len(value_queue.items) == 2
+        assert len(property_queue.items) == 1
+
+        # A metadata change publishes DBE_PROPERTY, reaching only the
+        # property subscription.
+        await data.write_metadata(precision=3)
+        assert len(value_queue.items) == 2
+        assert len(property_queue.items) == 2
+
+    asyncio.get_event_loop().run_until_complete(test())
+
+
+def test_array_ctrl_limits_enforced():
+    async def test():
+        data = ca.ChannelDouble(value=[0.0, 1.0], max_length=5,
+                                lower_ctrl_limit=-10, upper_ctrl_limit=10)
+        # In-band arrays are accepted...
+        await data.write([1.0, 2.0, 3.0])
+        assert list(data.value) == [1.0, 2.0, 3.0]
+
+        # ... but any element beyond a control limit rejects the write.
+        with pytest.raises(ca.CaprotoValueError):
+            await data.write([1.0, 100.0])
+        with pytest.raises(ca.CaprotoValueError):
+            await data.write([-100.0, 1.0])
+        assert list(data.value) == [1.0, 2.0, 3.0]
+
+    asyncio.get_event_loop().run_until_complete(test())
+
+
 @pytest.mark.parametrize('async_lib', ['asyncio', 'curio', 'trio'])
 def test_process_field(request, prefix, async_lib):
     run_example_ioc('caproto.tests.ioc_process', request=request,
@@ -43,3 +43,17 @@ def test_timestamp_flexible_epics_copy():
     ts = ca.TimeStamp.from_flexible_value(ca.TimeStamp(2, 3))
     assert ts.secondsSinceEpoch == 2
     assert ts.nanoSeconds == 3
+
+
+def test_timestamp_pre_epics_epoch():
+    from caproto._dbr import EPICS2UNIX_EPOCH, timestamp_to_epics
+
+    # A timestamp slightly before the EPICS epoch splits into a negative
+    # fraction; nanoseconds must still come out normalized, or they would
+    # wrap in the uint32 nanoSeconds field.
+    sec, nano = timestamp_to_epics(EPICS2UNIX_EPOCH - 0.25)
+    assert sec == -1
+    assert nano == 750000000
+
+    sec, nano = timestamp_to_epics(EPICS2UNIX_EPOCH)
+    assert (sec, nano) == (0, 0)
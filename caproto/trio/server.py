@@ -222,10 +222,10 @@ class Context(_Context):
         async with send:
             async with recv:
                 task_status.started()
-                async for item in recv:
-                    sub_specs, metadata, values, flags, sub = item
-                    await self._subscription_queue_iteration(
-                        sub_specs, metadata, values, flags, sub)
+                async for batch in recv:
+                    for sub_specs, metadata, values, flags, sub in batch:
+                        await self._subscription_queue_iteration(
+                            sub_specs, metadata, values, flags, sub)
 
     async def broadcast_beacon_loop(self, task_status):
         task_status.started()